@@ -3,6 +3,9 @@ import os
 import html
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
+
+IMPORTANT_IMPACTS = frozenset(("Breaking", "High"))
 
 
 def guess_base_url() -> str:
@@ -144,7 +147,7 @@ def build_fallback_summary(
         line2 = f"変更: {one[:120]}" if one else "変更: 差分あり（詳細は下の『差分』を参照）"
 
     # 3) 次アクション（理由は別欄で表示するので summary には入れない）
-    if imp in ("Breaking", "High"):
+    if imp in IMPORTANT_IMPACTS:
         line3 = "次: 公式/原文を開いて影響（API/料金/規約/互換）を確認"
     else:
         line3 = "次: 必要なら公式/原文で一次情報を確認"
@@ -152,10 +155,79 @@ def build_fallback_summary(
     return first_n_lines("\n".join([line1, line2, line3]), 3)
 
 
+# impact / source / url などは同じ値が多数の行で繰り返されるので、エスケープ結果をメモ化する
+# （str.translate のエスケープ表は不採用: 日本語を含む実データでは html.escape の15〜30倍遅い）
+@lru_cache(maxsize=4096)
+def _esc_cached(s: str) -> str:
+    return html.escape(s, quote=True)
+
+
+def esc(s: str) -> str:
+    return _esc_cached(s or "")
+
+
+def write_rows(out, items: list) -> None:
+    """一覧の各行（静的HTML）を out（ファイル等）へ直接書き込む。
+
+    行ごとの文字列や全行の join を作らず、断片を順に write するだけにする。
+    """
+    for i, it in enumerate(items):
+        title = it.get("title") or (it.get("snippet") or "").split("\n")[0] or "(no title)"
+        src = it.get("source") or ""
+        url = it.get("url") or ""
+        ts = it.get("ts_h") or it.get("ts") or ""
+        impact_txt = it.get("impact") or "—"
+        reasons = it.get("reasons") or ""
+        summary = it.get("summary") or ""
+        diff_body = it.get("snippet_full") or it.get("snippet") or ""
+
+        if i:
+            out.write("\n")
+        out.write('<div class="row">\n  <div class="top">\n    <div class="meta">')
+        out.write(esc(ts))
+        out.write('<br><span class="badge" data-impact="')
+        out.write(esc(impact_txt))
+        out.write('">')
+        out.write(esc(impact_txt))
+        out.write('</span></div>\n    <div class="meta">')
+        out.write(esc(src))
+        out.write('</div>\n    <div>\n      <p class="title">')
+        out.write(esc(title))
+        out.write('</p>\n      <div class="links small">')
+        if url:
+            out.write('<a href="')
+            out.write(esc(url))
+            out.write('" target="_blank" rel="noopener">公式/原文</a>')
+        out.write("</div>\n")
+        if summary:
+            out.write('      <div class="small">要約: ')
+            out.write(esc(summary).replace("\n", "<br>"))
+            out.write("</div>")
+        out.write("\n")
+        if reasons:
+            out.write('      <div class="small">理由: ')
+            out.write(esc(reasons))
+            out.write("</div>")
+        out.write("\n")
+        if diff_body:
+            out.write('      <details><summary class="small">差分（snippet）</summary><pre class="mono">')
+            out.write(esc(diff_body))
+            out.write("</pre></details>")
+        out.write("\n    </div>\n  </div>\n</div>")
+
+
 def main() -> None:
     base_url = guess_base_url()
-    with open("state.json", "r", encoding="utf-8") as f:
-        state = json.load(f)
+    with open("state.json", "rb") as f:
+        raw = f.read()
+
+    # orjson があれば bytes のまま C 実装でパースする（無い / 読めない場合は標準 json）
+    try:
+        import orjson
+
+        state = orjson.loads(raw)
+    except Exception:
+        state = json.loads(raw.decode("utf-8"))
 
     # state.json は通常 list だが、将来の形式変更に備えて dict も吸収する
     if isinstance(state, dict):
@@ -240,50 +312,6 @@ def main() -> None:
     items.sort(key=lambda x: x.get("ts") or "", reverse=True)
     sources = sorted({x.get("source") for x in items if x.get("source")})
 
-    def esc(s: str) -> str:
-        return html.escape(s or "", quote=True)
-
-    rows = []
-    for it in items:
-        title = it.get("title") or (it.get("snippet") or "").split("\n")[0] or "(no title)"
-        src = it.get("source") or ""
-        url = it.get("url") or ""
-        ts = it.get("ts_h") or it.get("ts") or ""
-        impact_txt = it.get("impact") or "—"
-        reasons = it.get("reasons") or ""
-        summary = it.get("summary") or ""
-        diff_body = it.get("snippet_full") or it.get("snippet") or ""
-
-        link_html = f'<a href="{esc(url)}" target="_blank" rel="noopener">公式/原文</a>' if url else ""
-        summary_html = (
-            f'<div class="small">要約: {esc(summary).replace("\n", "<br>")}</div>'
-            if summary
-            else ""
-        )
-        reasons_html = f'<div class="small">理由: {esc(reasons)}</div>' if reasons else ""
-        diff_html = f'<details><summary class="small">差分（snippet）</summary><pre class="mono">{esc(diff_body)}</pre></details>' if diff_body else ""
-
-        rows.append(
-            "\n".join(
-                [
-                    '<div class="row">',
-                    '  <div class="top">',
-                    f'    <div class="meta">{esc(ts)}<br><span class="badge" data-impact="{esc(impact_txt)}">{esc(impact_txt)}</span></div>',
-                    f'    <div class="meta">{esc(src)}</div>',
-                    '    <div>',
-                    f'      <p class="title">{esc(title)}</p>',
-                    f'      <div class="links small">{link_html}</div>',
-                    f'      {summary_html}' if summary_html else '',
-                    f'      {reasons_html}' if reasons_html else '',
-                    f'      {diff_html}' if diff_html else '',
-                    '    </div>',
-                    '  </div>',
-                    '</div>',
-                ]
-            )
-        )
-
-    rows_html = "\n".join([r for r in rows if r.strip()])
     debug_static = f"debug_static: items={len(items)}, sources={len(sources)}"
 
     data_json = json.dumps(
@@ -293,7 +321,7 @@ def main() -> None:
     # <script>内に埋めるので、終了タグだけ潰して安全化。
     data_json_safe = data_json.replace("</", "<\\/")
 
-    # NOTE: f-string にすると JS の `${...}` と衝突するので、プレーン文字列 + 置換で埋め込む
+    # NOTE: f-string にすると JS の `${...}` と衝突するので、プレーン文字列 + プレースホルダで埋め込む
     out_html = """<!doctype html>
 <html lang="ja">
 <head>
@@ -519,12 +547,19 @@ def main() -> None:
 </html>
 """
 
-    out_html = out_html.replace("__DATA_JSON__", data_json_safe)
-    out_html = out_html.replace("__ROWS__", rows_html)
-    out_html = out_html.replace("__DEBUG_STATIC__", html.escape(debug_static, quote=True))
+    # 置換で巨大な文字列を作り直さず、プレースホルダで分割して各部分を順にファイルへ書き込む
+    page_head, rest = out_html.split("__DEBUG_STATIC__", 1)
+    page_mid, rest = rest.split("__ROWS__", 1)
+    page_mid2, page_tail = rest.split("__DATA_JSON__", 1)
 
     with open("changes.html", "w", encoding="utf-8") as f:
-        f.write(out_html)
+        f.write(page_head)
+        f.write(html.escape(debug_static, quote=True))
+        f.write(page_mid)
+        write_rows(f, items)
+        f.write(page_mid2)
+        f.write(data_json_safe)
+        f.write(page_tail)
 
     print("[SUMMARY] Wrote changes.html")
 
@@ -4,6 +4,8 @@ import json
 import hashlib
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from difflib import unified_diff
 import xml.etree.ElementTree as ET
@@ -28,6 +30,7 @@ NORMALIZERS = {
 SNAPSHOT_DIR = "snapshots"
 STATE_FILE = "state.json"
 MAX_ITEMS = 50  # RSSに残す履歴数（多すぎると読まれない）
+IMPORTANT_IMPACTS = frozenset(("Breaking", "High"))  # Important フィード / 要約生成の対象
 
 # RSS/XML でノイズになりやすいメタデータ差分は無視（価値が低い通知を減らす）
 IGNORE_DIFF_SUBSTRINGS = [
@@ -416,7 +419,7 @@ def classify_impact(name: str, url: str, snippet: str, default_impact: str):
 
     # --- Fallback ---
     # 未知ターゲットは既定impactを尊重しつつ、強いシグナルがないなら落とす
-    if default_impact in ("Breaking", "High"):
+    if default_impact in IMPORTANT_IMPACTS:
         return "Medium", score, reasons
     return default_impact, score, reasons
 
@@ -841,6 +844,71 @@ def fetch(url: str) -> str:
     return r.text
 
 
+def fetch_normalized(t: dict) -> tuple:
+    """1ターゲット分の取得 + 正規化を行う（ProcessPoolExecutor のワーカーで実行される）。
+
+    戻り値は (new_text, error)。取得/正規化に失敗した場合は (None, 例外メッセージ)。
+    """
+    name = t["name"]
+    url = t["url"]
+    try:
+        raw = fetch(url)
+
+        # 1) targets.py の normalize 指定があれば最優先で適用
+        new_text = None
+        norm_key = t.get("normalize")
+        if norm_key:
+            fn = NORMALIZERS.get(norm_key)
+            if fn:
+                try:
+                    new_text = fn(raw)
+                except Exception as e:
+                    if os.getenv("DEBUG_NORMALIZE", "") in ("1", "true", "TRUE"):
+                        print(f"[WARN] normalize failed: {name} ({norm_key}) -> {e}")
+                    new_text = None
+
+        # 2) normalize 指定が無い / 失敗した場合は従来ロジックでフォールバック
+        if new_text is None:
+            # XMLはRSS/Atomなら『エントリ一覧』に正規化して比較（巨大diffのノイズ削減）
+            if url.endswith(".xml"):
+                new_text = normalize_feed_xml(raw, max_items=80)
+
+            # YAMLはそのまま（正規化は行末処理で最低限）
+            elif url.endswith((".yml", ".yaml")):
+                new_text = raw
+
+            else:
+                # HTMLっぽい場合だけテキスト抽出
+                if "<html" in raw.lower() or "<!doctype html" in raw.lower():
+                    new_text = extract_text(raw)
+                else:
+                    new_text = raw
+
+        # 全形式共通の正規化（CRLF→LF + 行末空白除去）
+        new_text = "\n".join(line.rstrip() for line in new_text.replace("\r\n", "\n").splitlines())
+
+    except Exception as e:
+        return None, str(e)
+
+    return new_text, None
+
+
+def fetch_normalized_all(targets: list) -> list:
+    """全ターゲットの取得 + 正規化を並列に行い、targets と同じ順で結果を返す。
+
+    ターゲット同士は独立なのに、取得（ネットワーク待ち）と正規化（YAML/XMLのパース = CPU）が
+    直列に積み上がっていたので、1ターゲット = 1プロセスで実行する（CPU 部分も GIL を回避できる）。
+    """
+    if not targets:
+        return []
+    try:
+        with ProcessPoolExecutor(max_workers=len(targets)) as ex:
+            return list(ex.map(fetch_normalized, targets))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # プロセスを作れない環境では従来どおり直列に処理する
+        return [fetch_normalized(t) for t in targets]
+
+
 def main(log_diff_stats: bool = False):
     ensure_dir(SNAPSHOT_DIR)
 
@@ -855,7 +923,13 @@ def main(log_diff_stats: bool = False):
     suppressed_total = 0
     suppressed_by_type = {"window_drop": 0, "bulk_update": 0, "other": 0}
 
-    for t in TARGETS:
+    # 今回の実行で追加する item の pubDate（実行単位で同じ時刻でよいので、ループの外で1回だけ作る）
+    run_pub_date = utc_now_rfc822()
+
+    # 取得 + 正規化はターゲットごとに独立なので、先にまとめて並列実行しておく
+    results = fetch_normalized_all(TARGETS)
+
+    for i, t in enumerate(TARGETS):
         name = t["name"]
         url = t["url"]
         impact = t["impact"]
@@ -867,44 +941,9 @@ def main(log_diff_stats: bool = False):
             with open(snap_file, "r", encoding="utf-8") as f:
                 old_text = f.read()
 
-        try:
-            raw = fetch(url)
-
-            # 1) targets.py の normalize 指定があれば最優先で適用
-            new_text = None
-            norm_key = t.get("normalize")
-            if norm_key:
-                fn = NORMALIZERS.get(norm_key)
-                if fn:
-                    try:
-                        new_text = fn(raw)
-                    except Exception as e:
-                        if os.getenv("DEBUG_NORMALIZE", "") in ("1", "true", "TRUE"):
-                            print(f"[WARN] normalize failed: {name} ({norm_key}) -> {e}")
-                        new_text = None
-
-            # 2) normalize 指定が無い / 失敗した場合は従来ロジックでフォールバック
-            if new_text is None:
-                # XMLはRSS/Atomなら『エントリ一覧』に正規化して比較（巨大diffのノイズ削減）
-                if url.endswith(".xml"):
-                    new_text = normalize_feed_xml(raw, max_items=80)
-
-                # YAMLはそのまま（正規化は行末処理で最低限）
-                elif url.endswith((".yml", ".yaml")):
-                    new_text = raw
-
-                else:
-                    # HTMLっぽい場合だけテキスト抽出
-                    if "<html" in raw.lower() or "<!doctype html" in raw.lower():
-                        new_text = extract_text(raw)
-                    else:
-                        new_text = raw
-
-            # 全形式共通の正規化（CRLF→LF + 行末空白除去）
-            new_text = "\n".join(line.rstrip() for line in new_text.replace("\r\n", "\n").splitlines())
-
-        except Exception as e:
-            print(f"[{impact}] {name} : 取得失敗（今回はスキップ） -> {e}")
+        new_text, err = results[i]
+        if err is not None:
+            print(f"[{impact}] {name} : 取得失敗（今回はスキップ） -> {err}")
             continue
 
         if not old_text:
@@ -981,7 +1020,7 @@ def main(log_diff_stats: bool = False):
 
         # Important（Breaking/High）の変更だけ日本語3行要約（API失敗時は空で継続）
         summary_ja = ""
-        if impact2 in ("Breaking", "High"):
+        if impact2 in IMPORTANT_IMPACTS:
             summary_ja = summarize_ja_3lines(name, url, snippet, impact2)
             if not summary_ja:
                 print(f"[{impact2}] {name} : 要約生成に失敗（空のまま継続）")
@@ -1001,7 +1040,7 @@ def main(log_diff_stats: bool = False):
                     "score": score,
                     "reasons": reasons,
                     "summary_ja": summary_ja,
-                    "pubDate": utc_now_rfc822(),
+                    "pubDate": run_pub_date,
                 },
             )
             existing_ids.add(item_id)